@@ -0,0 +1,51 @@
+"""
+Numba-Compiled Sampling Kernels
+
+Native-code implementations of the bassline sampling hot loop. Importing
+this module requires numba; callers should fall back to the pure NumPy
+path when it is unavailable.
+"""
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def sample_bassline(patterns, scale_lower, durations, num_bars, density, seed=-1):
+    """
+    Sample bassline notes for num_bars bars of 16 steps in native code.
+
+    Args:
+        patterns (numpy.ndarray): (n_patterns, 16) int8 rhythm pattern grid
+        scale_lower (numpy.ndarray): Lower-half scale MIDI note numbers
+        durations (numpy.ndarray): Available note durations in beats
+        num_bars (int): Number of bars to generate
+        density (float): Probability of keeping each pattern hit
+        seed (int, optional): RNG seed; negative leaves the RNG state alone
+
+    Returns:
+        tuple: (notes, positions, durations) parallel arrays for the
+            sampled steps
+    """
+    if seed >= 0:
+        np.random.seed(seed)
+
+    max_notes = num_bars * 16
+    out_notes = np.empty(max_notes, dtype=np.int8)
+    out_positions = np.empty(max_notes, dtype=np.int32)
+    out_durations = np.empty(max_notes, dtype=np.float32)
+
+    n_patterns = patterns.shape[0]
+    n_scale = scale_lower.shape[0]
+    n_durations = durations.shape[0]
+    count = 0
+
+    for bar in range(num_bars):
+        pattern_index = np.random.randint(0, n_patterns)
+        for step in range(16):
+            if patterns[pattern_index, step] and np.random.random() <= density:
+                out_notes[count] = scale_lower[np.random.randint(0, n_scale)]
+                out_positions[count] = bar * 16 + step
+                out_durations[count] = durations[np.random.randint(0, n_durations)]
+                count += 1
+
+    return out_notes[:count], out_positions[:count], out_durations[:count]
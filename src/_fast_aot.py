@@ -0,0 +1,27 @@
+"""
+Ahead-of-Time Compiled Sampling Kernel
+
+Builds a precompiled extension module for the bassline sampling kernel so
+first use pays no JIT-compile latency. Run this file directly at build
+time to produce the _fast_aot extension next to it:
+
+    python _fast_aot.py
+
+When the extension is present it shadows this source module on import;
+otherwise importing this module falls through to the JIT-compiled kernel.
+"""
+
+from numba.pycc import CC
+from _fast import sample_bassline
+
+cc = CC('_fast_aot')
+
+@cc.export(
+    'sample_bassline',
+    'Tuple((i1[:], i4[:], f4[:]))(i1[:,:], i8[:], f4[:], i8, f8, i8)'
+)
+def _sample_bassline_aot(patterns, scale_lower, durations, num_bars, density, seed):
+    return sample_bassline(patterns, scale_lower, durations, num_bars, density, seed)
+
+if __name__ == '__main__':
+    cc.compile()
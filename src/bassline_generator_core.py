@@ -4,40 +4,125 @@ Bassline Generation Core Module
 Generates MIDI basslines with configurable musical parameters.
 """
 
-import random
-from midiutil import MIDIFile
+import concurrent.futures
+import numpy as np
 import os
-from datetime import datetime
+import time
 from musical_scales import MusicalScales
 from pathlib import Path
 
+# Native sampling kernel. Prefer the AOT-compiled extension (no first-call
+# compile latency), then the JIT kernel; numba itself is optional, so fall
+# back to pure NumPy when neither imports.
+try:
+    from _fast_aot import sample_bassline as _sample_bassline
+except ImportError:
+    try:
+        from _fast import sample_bassline as _sample_bassline
+    except ImportError:
+        _sample_bassline = None
+
+# Structure-of-arrays layout for generated basslines: four packed fields
+# instead of one Python dict (and its per-key hashing) per note
+BASSLINE_DTYPE = np.dtype([
+    ('note', np.int8),
+    ('position', np.int32),
+    ('duration', np.float32),
+    ('velocity', np.int8)
+])
+
+# Rhythm patterns for different genres, stacked into contiguous
+# (n_patterns, 16) int8 arrays. Frozen at module scope so every generator
+# instance and worker thread shares the same read-only buffers.
+_RHYTHM_PATTERNS = {
+    'Funk': np.array([
+        [1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 1, 1, 0],
+        [1, 0, 1, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 1, 0, 0]
+    ], dtype=np.int8),
+    'Darksynth': np.array([
+        [1, 0, 0, 1, 0, 0, 1, 0, 1, 0, 1, 1, 0, 1, 0, 0],
+        [1, 0, 1, 0, 1, 1, 0, 0, 1, 0, 0, 1, 1, 0, 1, 0]
+    ], dtype=np.int8),
+    'Pop': np.array([
+        [1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0],
+        [1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 0]
+    ], dtype=np.int8),
+    'Trap': np.array([
+        [1, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0],
+        [1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0]
+    ], dtype=np.int8)
+}
+for _patterns in _RHYTHM_PATTERNS.values():
+    _patterns.flags.writeable = False
+
+# Available note durations in beats, frozen for the same reason
+_DURATIONS = np.array([0.25, 0.5, 0.75, 1.0, 1.5, 2.0], dtype=np.float32)
+_DURATIONS.flags.writeable = False
+
+# Per-process generator for batch workers, created lazily so each worker
+# process pays construction (and kernel import) exactly once
+_worker_generator = None
+
+def _batch_worker(params):
+    """Generate one bassline inside a worker process."""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = BasslineGenerator()
+    return _worker_generator.generate_bassline(**params)
+
+# Deletion table for unsafe filename characters, built once so
+# sanitizing runs as a single C-level str.translate pass
+_FILENAME_TRANS = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c in ' -_.')
+))
+
 class BasslineGenerator:
     def __init__(self):
         """Initialize bassline generator with rhythm patterns and note configurations."""
         self.musical_scales = MusicalScales()
-        
-        # Define rhythm patterns for different genres
-        self.rhythm_patterns = {
-            'Funk': [
-                [1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 1, 1, 0],
-                [1, 0, 1, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 1, 0, 0] 
-            ],
-            'Darksynth': [
-                [1, 0, 0, 1, 0, 0, 1, 0, 1, 0, 1, 1, 0, 1, 0, 0],
-                [1, 0, 1, 0, 1, 1, 0, 0, 1, 0, 0, 1, 1, 0, 1, 0]
-            ],
-            'Pop': [
-                [1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0],
-                [1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 0]
-            ],
-            'Trap': [
-                [1, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0],
-                [1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0]
-            ]
-        }
-        
-        # Available note durations in beats
-        self.note_durations = [0.25, 0.5, 0.75, 1.0, 1.5, 2.0]
+
+        # Shared read-only rhythm pattern and duration tables
+        self.rhythm_patterns = _RHYTHM_PATTERNS
+        self.note_durations = _DURATIONS.tolist()
+        self._durations_arr = _DURATIONS
+
+        # Per-instance PCG64 generator: faster per draw than the module-global
+        # Mersenne Twister and supports vectorized batch draws
+        self._rng = np.random.default_rng()
+
+        # Genre names sorted once; get_available_genres reuses this tuple
+        self._available_genres = tuple(sorted(self.rhythm_patterns.keys()))
+
+        # Cache of lower-half scale arrays keyed by (root_note, scale_type);
+        # the parameter space is tiny, so repeat generations skip scale construction
+        self._scale_cache = {}
+
+        # Desktop path resolved lazily on first save and reused afterwards
+        self._desktop_path = None
+
+    def _get_lower_scale_array(self, root_note, scale_type):
+        """
+        Get the lower-half scale notes as a cached NumPy array.
+
+        Args:
+            root_note (str): Root note for scale generation (e.g., 'C', 'F#')
+            scale_type (str): Type of musical scale (e.g., 'major', 'minor')
+
+        Returns:
+            numpy.ndarray: MIDI note numbers from the lower half of the scale
+        """
+        key = (root_note, scale_type)
+        scale_arr = self._scale_cache.get(key)
+        if scale_arr is None:
+            scale_notes = self.musical_scales.generate_scale_np(root_note, scale_type)
+            lower_half_notes = scale_notes[:len(scale_notes)//2]
+            if len(lower_half_notes) == 0:
+                lower_half_notes = scale_notes
+            # Explicit int64 keeps the dtype stable across platforms; the
+            # AOT kernel signature expects it
+            scale_arr = lower_half_notes.astype(np.int64)
+            self._scale_cache[key] = scale_arr
+        return scale_arr
 
     def generate_bassline(self, root_note, scale_type, genre, num_bars=4, note_density=1.0):
         """
@@ -51,45 +136,49 @@ class BasslineGenerator:
             note_density (float, optional): Probability of note generation. Defaults to 1.0.
         
         Returns:
-            list: Generated bassline with note details
+            numpy.ndarray: Generated bassline as a structured array with
+                'note', 'position', 'duration' and 'velocity' fields
         """
-        # Generate scale notes
-        scale_notes = self.musical_scales.generate_scale(root_note, scale_type)
-        bassline = []
-        
-        for bar in range(num_bars):
-            # Select a random rhythm pattern for the genre
-            pattern = random.choice(self.rhythm_patterns[genre])
-            
-            for step, hit in enumerate(pattern):
-                if hit and random.random() <= note_density:
-                    # Select notes from lower half of the scale
-                    lower_half_notes = scale_notes[:len(scale_notes)//2]
-                    if not lower_half_notes:
-                        lower_half_notes = scale_notes
-                    
-                    note = random.choice(lower_half_notes)
-                    duration = random.choice(self.note_durations)
-                    
-                    note_data = {
-                        'note': note,
-                        'position': (bar * 16) + step,
-                        'duration': duration,
-                        'velocity': 100
-                    }
-                    
-                    bassline.append(note_data)
-        
-        # Ensure at least one note is generated
-        if not bassline:
-            note = random.choice(scale_notes[:len(scale_notes)//2])
-            bassline.append({
-                'note': note,
-                'position': 0,
-                'duration': 1.0,
-                'velocity': 100
-            })
-        
+        # Fetch the cached lower-half scale notes for this (root, scale) pair
+        scale_arr = self._get_lower_scale_array(root_note, scale_type)
+        patterns = self.rhythm_patterns[genre]
+        durations_arr = self._durations_arr
+
+        if _sample_bassline is not None:
+            # Native-code path: the whole sampling loop runs inside numba
+            notes, positions, durations = _sample_bassline(
+                patterns, scale_arr, durations_arr, num_bars, float(note_density), -1
+            )
+            bassline = np.empty(len(notes), dtype=BASSLINE_DTYPE)
+            bassline['note'] = notes
+            bassline['position'] = positions
+            bassline['duration'] = durations
+            bassline['velocity'] = 100
+        else:
+            # Draw one rhythm pattern per bar and apply the density mask in bulk,
+            # replacing the per-step Python RNG calls with a few vectorized draws
+            pattern_indices = self._rng.integers(0, patterns.shape[0], size=num_bars)
+            hit_grid = patterns[pattern_indices] & (self._rng.random((num_bars, 16)) <= note_density)
+            active_steps = np.argwhere(hit_grid)
+
+            # Sample by scaled uniform index instead of np.random.choice,
+            # which re-validates its arguments on every call
+            num_notes = len(active_steps)
+            note_indices = (self._rng.random(num_notes) * len(scale_arr)).astype(np.int64)
+            duration_indices = (self._rng.random(num_notes) * len(durations_arr)).astype(np.int64)
+
+            bassline = np.empty(num_notes, dtype=BASSLINE_DTYPE)
+            bassline['note'] = scale_arr[note_indices]
+            bassline['position'] = active_steps[:, 0] * 16 + active_steps[:, 1]
+            bassline['duration'] = durations_arr[duration_indices]
+            bassline['velocity'] = 100
+
+        # Ensure at least one note is generated: when every draw missed,
+        # deterministically place the root on the downbeat instead of
+        # spending another RNG call
+        if len(bassline) == 0:
+            bassline = np.array([(scale_arr[0], 0, 1.0, 100)], dtype=BASSLINE_DTYPE)
+
         return bassline
 
     def get_available_genres(self):
@@ -97,75 +186,158 @@ class BasslineGenerator:
         Retrieve all available rhythm genres.
         
         Returns:
-            list: Available genre names sorted alphabetically
+            tuple: Available genre names sorted alphabetically
+        """
+        return self._available_genres
+
+    def generate_batch(self, params_list):
+        """
+        Generate several basslines in parallel across CPU cores.
+
+        Each worker process runs the sampling kernel independently, so
+        large batches (e.g. "generate 50 variations") scale with core
+        count instead of running serially under the GIL.
+
+        Args:
+            params_list (list): Dicts of generate_bassline keyword
+                arguments, one per bassline to generate
+
+        Returns:
+            list: Generated basslines in the same order as params_list
+        """
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            return list(pool.map(_batch_worker, params_list))
+
+    def _get_desktop_path(self):
+        """
+        Resolve the Desktop save directory, caching the result.
+
+        The location never changes during a session, so the
+        home-directory and OneDrive checks only run on the first save.
+
+        Returns:
+            Path: Directory where MIDI files are saved
         """
-        return sorted(list(self.rhythm_patterns.keys()))
+        if self._desktop_path is None:
+            # Get Desktop path with OneDrive compatibility
+            # Try standard Desktop path first
+            desktop_path = Path.home() / "Desktop"
+
+            # If standard path doesn't exist, try OneDrive path
+            if not desktop_path.exists():
+                onedrive_path = Path.home() / "OneDrive" / "Desktop"
+                if onedrive_path.exists():
+                    desktop_path = onedrive_path
+                else:
+                    # Create Desktop directory if it doesn't exist
+                    desktop_path.mkdir(parents=True, exist_ok=True)
+
+            self._desktop_path = desktop_path
+
+        return self._desktop_path
 
     def create_midi_file(self, bassline, filename=None, tempo=120):
         """
         Create a MIDI file from the generated bassline and save to Desktop.
         
         Args:
-            bassline (list): Generated bassline notes
+            bassline (numpy.ndarray): Generated bassline notes as a structured array
             filename (str, optional): Output filename. Defaults to timestamp-based name.
             tempo (int, optional): Tempo in beats per minute. Defaults to 120.
-        
+
         Returns:
             str: Full path to the created MIDI file
-        
+
         Raises:
             ValueError: If bassline is empty
             OSError: If unable to access or write to Desktop directory
         """
-        if not bassline:
+        if len(bassline) == 0:
             raise ValueError("Cannot create MIDI file with empty bassline")
-        
-        # MIDI file creation setup
-        midi = MIDIFile(1)  # One track
-        track = 0
-        time = 0
-        channel = 0
-        
-        midi.addTrackName(track, time, "Bassline")
-        midi.addTempo(track, time, tempo)
-        
-        # Add notes to MIDI file
-        for note in bassline:
-            beat_position = note['position'] / 4.0
-            midi.addNote(
-                track, channel, 
-                note['note'], beat_position,
-                note['duration'], note['velocity']
-            )
-        
-        # Generate filename if not provided
+
+        # Generate filename if not provided; time.strftime skips the
+        # datetime object allocation a datetime.now() round-trip would pay
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"bassline_{timestamp}.mid"
-        
+
         try:
-            # Get Desktop path with OneDrive compatibility
-            # Try standard Desktop path first
-            desktop_path = Path.home() / "Desktop"
-            
-            # If standard path doesn't exist, try OneDrive path
-            if not desktop_path.exists():
-                onedrive_path = Path.home() / "OneDrive" / "Desktop"
-                if onedrive_path.exists():
-                    desktop_path = onedrive_path
-                else:
-                    # Create Desktop directory if it doesn't exist
-                    desktop_path.mkdir(parents=True, exist_ok=True)
-            
+            desktop_path = self._get_desktop_path()
+
             # Ensure filename is safe
-            safe_filename = "".join(c for c in filename if c.isalnum() or c in (' ', '-', '_', '.'))
+            safe_filename = filename.translate(_FILENAME_TRANS)
             filepath = desktop_path / safe_filename
-            
-            # Create MIDI file
-            with open(filepath, "wb") as output_file:
-                midi.writeFile(output_file)
-            
+
+            self._write_midi(bassline, filepath, tempo)
+
             return str(filepath)
-            
+
         except OSError as e:
             raise OSError(f"Failed to save MIDI file to Desktop: {str(e)}")
+
+    def _write_midi(self, bassline, filepath, tempo):
+        """
+        Write the bassline to filepath, preferring the symusic backend.
+
+        symusic consumes the bassline field arrays directly and writes the
+        MIDI in C++ with no per-note Python dispatch; midiutil remains the
+        fallback when symusic is not installed.
+
+        Args:
+            bassline (numpy.ndarray): Generated bassline notes as a structured array
+            filepath (Path): Destination MIDI file path
+            tempo (int): Tempo in beats per minute
+        """
+        # Imported on first save rather than at module load, so the GUI
+        # window can appear before the backend's import cost is paid for
+        try:
+            import symusic
+        except ImportError:
+            symusic = None
+
+        if symusic is not None:
+            ticks_per_quarter = 480
+            ticks_per_step = ticks_per_quarter // 4
+
+            track = symusic.Track(name="Bassline")
+            track.notes = symusic.core.NoteTickList.from_numpy(
+                (bassline['position'] * ticks_per_step).astype(np.int32),
+                (bassline['duration'] * ticks_per_quarter).astype(np.int32),
+                bassline['note'],
+                bassline['velocity']
+            )
+
+            score = symusic.Score(ticks_per_quarter)
+            score.tempos.append(symusic.Tempo(0, float(tempo)))
+            score.tracks.append(track)
+            try:
+                score.dump_midi(str(filepath))
+            except RuntimeError as e:
+                # symusic surfaces I/O failures as RuntimeError; normalize
+                # so callers see the same OSError as the midiutil path
+                raise OSError(str(e))
+            return
+
+        from midiutil import MIDIFile
+
+        # MIDI file creation setup
+        midi = MIDIFile(1)  # One track
+        track = 0
+        start_time = 0
+        channel = 0
+
+        midi.addTrackName(track, start_time, "Bassline")
+        midi.addTempo(track, start_time, tempo)
+
+        # Add notes to MIDI file. Beat positions come from one vectorized
+        # multiply, and .tolist() converts each field to native Python
+        # scalars in bulk so midiutil never boxes numpy scalars per note.
+        beat_positions = bassline['position'].astype(np.float32) * 0.25
+        for pitch, position, duration, velocity in zip(
+            bassline['note'].tolist(), beat_positions.tolist(),
+            bassline['duration'].tolist(), bassline['velocity'].tolist()
+        ):
+            midi.addNote(track, channel, pitch, position, duration, velocity)
+
+        with open(filepath, "wb") as output_file:
+            midi.writeFile(output_file)
@@ -4,7 +4,10 @@ Dice Roll Module for Bassline Generator
 This module provides randomization utilities for generating musical parameters.
 """
 
-import random
+import numpy as np
+
+# Shared PCG64 generator for rolls made without an explicit rng
+_DEFAULT_RNG = np.random.default_rng()
 
 class DiceRoller:
     """
@@ -17,29 +20,33 @@ class DiceRoller:
     """
     
     @staticmethod
-    def roll_parameters(generator):
+    def roll_parameters(generator, rng=None):
         """
         Randomly generate bassline generation parameters.
-        
+
         Args:
-            generator (BasslineGenerator): Bassline generation utility 
+            generator (BasslineGenerator): Bassline generation utility
                 providing access to available musical parameters
-        
+            rng (numpy.random.Generator, optional): Generator to draw from.
+                Defaults to a module-level shared generator.
+
         Returns:
             dict: Randomly selected parameters for bassline generation
-        
+
         Key Randomization Constraints:
         - Fixed 8-bar length for consistent musical phrasing
         - Tempo range: 60-180 BPM (musically practical)
         - Note density: 0.3-1.0 (ensures meaningful musical content)
         """
+        if rng is None:
+            rng = _DEFAULT_RNG
         return {
-            'root_note': random.choice(list(generator.musical_scales.root_notes.keys())),
-            'scale_type': random.choice(generator.musical_scales.get_available_scales()),
-            'genre': random.choice(generator.get_available_genres()),
-            'tempo': random.randint(60, 180),
+            'root_note': str(rng.choice(generator.musical_scales.sorted_root_notes)),
+            'scale_type': str(rng.choice(generator.musical_scales.get_available_scales())),
+            'genre': str(rng.choice(generator.get_available_genres())),
+            'tempo': int(rng.integers(60, 181)),
             'bars': 8,  # Consistent 8-bar phrase
-            'note_density': round(random.uniform(0.3, 1.0), 2)
+            'note_density': round(float(rng.uniform(0.3, 1.0)), 2)
         }
     
     @staticmethod
@@ -54,15 +61,18 @@ class DiceRoller:
         - Clear, structured visual representation
         - Highlights key musical characteristics
         """
-        print("\n🎲 Dice Roll Parameters 🎲")
-        print("-" * 30)
-        print(f"Root Note:     {params['root_note']}")
-        print(f"Scale Type:    {params['scale_type'].replace('_', ' ').title()}")
-        print(f"Genre:         {params['genre']}")
-        print(f"Tempo:         {params['tempo']} BPM")
-        print(f"Bars:          {params['bars']} (Fixed)")
-        print(f"Note Density:  {params['note_density']}")
-        print("-" * 30)
+        # One joined message means a single stdout write instead of nine
+        print(
+            "\n🎲 Dice Roll Parameters 🎲\n"
+            + "-" * 30 + "\n"
+            f"Root Note:     {params['root_note']}\n"
+            f"Scale Type:    {params['scale_type'].replace('_', ' ').title()}\n"
+            f"Genre:         {params['genre']}\n"
+            f"Tempo:         {params['tempo']} BPM\n"
+            f"Bars:          {params['bars']} (Fixed)\n"
+            f"Note Density:  {params['note_density']}\n"
+            + "-" * 30
+        )
     
     @staticmethod
     def interactive_roll(generator):
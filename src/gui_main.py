@@ -1,16 +1,19 @@
 # gui_main.py
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+import collections
+import concurrent.futures
+import os
+import random
 from bassline_generator_core import BasslineGenerator
 from dice_roller import DiceRoller
 from midi_preview import MIDIPreview
-import pygame
 import logging
 
-# Configure logging system with standard formatting
+# Configure logging system with standard formatting; set BASSLINE_LOG=DEBUG
+# for verbose output
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.environ.get('BASSLINE_LOG', 'INFO'),
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -25,14 +28,25 @@ class BasslineGeneratorGUI:
         self.root.title("Bassline Generator")
         self.root.geometry("800x600")
         
-        # Initialize core components
-        try:
-            self.generator = BasslineGenerator()
-            self.preview_system = MIDIPreview()
-            logger.debug("Core components initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize core components: {e}")
-            raise
+        # Backend objects are constructed off the Tk thread (see
+        # _init_backend) so the window paints before pygame's audio-device
+        # enumeration runs; handlers guard against them being None
+        self.generator = None
+        self.preview_system = None
+
+        # Persistent worker pool shared by backend init, previews and
+        # generations, instead of a fresh daemon thread per task
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix='bassline'
+        )
+
+        # Status messages are buffered and flushed in one insert per frame
+        # so bursts don't trigger a Text re-layout per message
+        self._status_buffer = collections.deque(maxlen=500)
+        self._status_flush_scheduled = False
+
+        # Pending preview-monitor callback, cancelled on stop
+        self._monitor_after_id = None
         
         # Create main container
         self.main_frame = ttk.Frame(root, padding="10")
@@ -43,9 +57,81 @@ class BasslineGeneratorGUI:
         self._create_generation_controls()
         self._create_status_area()
         self._apply_styling()
-        
+
+        # Mirror the Tk variables into a plain dict on write, so click
+        # handlers read cached Python values instead of making one Tcl
+        # round-trip per parameter
+        self._param_vars = {
+            'root_note': self.root_note_var,
+            'scale_type': self.scale_type_var,
+            'genre': self.genre_var,
+            'tempo': self.tempo_var,
+            'bars': self.bars_var,
+            'note_density': self.density_var
+        }
+        self._param_cache = {name: var.get() for name, var in self._param_vars.items()}
+        for name, var in self._param_vars.items():
+            var.trace_add('write', lambda *_, n=name, v=var: self._cache_param(n, v))
+
+        # Action buttons stay disabled until the backend is ready
+        self.preview_btn.state(['disabled'])
+        self.generate_btn.state(['disabled'])
+        self.dice_roll_btn.state(['disabled'])
+        self._update_status("Initializing audio engine...\n")
+        self._pool.submit(self._init_backend)
+
         logger.debug("GUI initialization complete")
 
+    def _init_backend(self):
+        """Construct the generator and preview system off the Tk thread"""
+        try:
+            generator = BasslineGenerator()
+            preview_system = MIDIPreview()
+            logger.debug("Core components initialized successfully")
+        except Exception as e:
+            logger.error("Failed to initialize core components: %s", e)
+            self.root.after(0, self._update_status, f"Initialization failed: {e}\n")
+            self.root.after(
+                0, messagebox.showerror,
+                "Error", f"Failed to initialize core components: {e}"
+            )
+            return
+        self.root.after(0, self._backend_ready, generator, preview_system)
+
+    def _backend_ready(self, generator, preview_system):
+        """Wire up backend-dependent UI state once initialization finishes"""
+        self.generator = generator
+        self.preview_system = preview_system
+
+        self.root_note_combo['values'] = generator.musical_scales.sorted_root_notes
+        self.scale_type_combo['values'] = generator.musical_scales.sorted_scales
+        self.genre_combo['values'] = generator.get_available_genres()
+        self.instrument_combo['values'] = preview_system.get_available_instruments()
+
+        self.preview_btn.state(['!disabled'])
+        self._enable_controls()
+        self._update_status("Ready\n")
+
+    def _cache_param(self, name, var):
+        """Store a parameter variable's new value in the Python-side cache"""
+        try:
+            self._param_cache[name] = var.get()
+        except tk.TclError:
+            # Mid-edit values can be momentarily unreadable; keep the old one
+            pass
+
+    def _current_params(self):
+        """Build the generation parameter dict from the cached variable values"""
+        cached = self._param_cache
+        return {
+            'root_note': cached['root_note'],
+            'scale_type': cached['scale_type'],
+            'genre': cached['genre'],
+            'tempo': int(cached['tempo']),
+            'bars': int(cached['bars']),
+            'note_density': float(cached['note_density'])
+        }
+
     def _create_parameter_controls(self):
         """Create and configure musical parameter input controls"""
         params_frame = ttk.LabelFrame(self.main_frame, text="Musical Parameters", padding="5")
@@ -54,29 +140,29 @@ class BasslineGeneratorGUI:
         # Root Note Selection
         ttk.Label(params_frame, text="Root Note:").grid(row=0, column=0, sticky=tk.W, pady=2)
         self.root_note_var = tk.StringVar(value='C')
-        root_note_combo = ttk.Combobox(params_frame, 
+        self.root_note_combo = ttk.Combobox(params_frame,
                                      textvariable=self.root_note_var,
-                                     values=sorted(self.generator.musical_scales.root_notes.keys()),
+                                     values=(),
                                      state='readonly')
-        root_note_combo.grid(row=0, column=1, sticky="ew", pady=2)
+        self.root_note_combo.grid(row=0, column=1, sticky="ew", pady=2)
         
         # Scale Type Selection
         ttk.Label(params_frame, text="Scale Type:").grid(row=1, column=0, sticky=tk.W, pady=2)
         self.scale_type_var = tk.StringVar(value='major')
-        scale_type_combo = ttk.Combobox(params_frame,
+        self.scale_type_combo = ttk.Combobox(params_frame,
                                       textvariable=self.scale_type_var,
-                                      values=sorted(self.generator.musical_scales.scales.keys()),
+                                      values=(),
                                       state='readonly')
-        scale_type_combo.grid(row=1, column=1, sticky="ew", pady=2)
+        self.scale_type_combo.grid(row=1, column=1, sticky="ew", pady=2)
         
         # Genre Selection
         ttk.Label(params_frame, text="Genre:").grid(row=2, column=0, sticky=tk.W, pady=2)
         self.genre_var = tk.StringVar(value='Funk')
-        genre_combo = ttk.Combobox(params_frame,
+        self.genre_combo = ttk.Combobox(params_frame,
                                  textvariable=self.genre_var,
-                                 values=self.generator.get_available_genres(),
+                                 values=(),
                                  state='readonly')
-        genre_combo.grid(row=2, column=1, sticky="ew", pady=2)
+        self.genre_combo.grid(row=2, column=1, sticky="ew", pady=2)
         
         # Tempo Control
         ttk.Label(params_frame, text="Tempo (BPM):").grid(row=3, column=0, sticky=tk.W, pady=2)
@@ -111,23 +197,24 @@ class BasslineGeneratorGUI:
         # Bass Instrument Selection
         ttk.Label(params_frame, text="Bass Instrument:").grid(row=6, column=0, sticky=tk.W, pady=2)
         self.instrument_var = tk.StringVar(value='Synth Bass 1')
-        instrument_combo = ttk.Combobox(params_frame,
+        self.instrument_combo = ttk.Combobox(params_frame,
                                       textvariable=self.instrument_var,
-                                      values=self.preview_system.get_available_instruments(),
+                                      values=(),
                                       state='readonly')
-        instrument_combo.grid(row=6, column=1, sticky="ew", pady=2)
-        
+        self.instrument_combo.grid(row=6, column=1, sticky="ew", pady=2)
+
         # Bind instrument change event
-        instrument_combo.bind('<<ComboboxSelected>>', self._on_instrument_change)
+        self.instrument_combo.bind('<<ComboboxSelected>>', self._on_instrument_change)
 
     def _on_instrument_change(self, event):
         """Handle instrument selection changes"""
+        if self.preview_system is None:
+            return
         try:
             self.preview_system.set_instrument(self.instrument_var.get())
-            self.status_text.insert(tk.END, f"Changed instrument to: {self.instrument_var.get()}\n")
-            self.status_text.see(tk.END)
+            self._update_status(f"Changed instrument to: {self.instrument_var.get()}\n")
         except Exception as e:
-            logger.error(f"Failed to change instrument: {e}")
+            logger.error("Failed to change instrument: %s", e)
             messagebox.showerror("Error", f"Failed to change instrument: {e}")
 
     def _create_generation_controls(self):
@@ -177,25 +264,31 @@ class BasslineGeneratorGUI:
         self.status_text.configure(yscrollcommand=scrollbar.set)
 
     def _preview_bassline(self):
-        """Generate and play a preview of the current bassline settings"""
+        """Kick off preview generation on the worker pool"""
+        if self.preview_system is None:
+            return
         logger.debug("Starting bassline preview generation")
         try:
             # Update UI state
             self.preview_btn.state(['disabled'])
             self.stop_preview_btn.state(['!disabled'])
-            
-            # Get current parameters
-            params = {
-                'root_note': self.root_note_var.get(),
-                'scale_type': self.scale_type_var.get(),
-                'genre': self.genre_var.get(),
-                'tempo': int(self.tempo_var.get()),
-                'bars': int(self.bars_var.get()),  # Use full bar count for preview
-                'note_density': float(self.density_var.get())
-            }
-            logger.debug(f"Preview parameters: {params}")
-            
-            # Generate bassline
+
+            # Get current parameters (full bar count is used for preview)
+            params = self._current_params()
+            logger.debug("Preview parameters: %s", params)
+
+            # Generation and file building run off the Tk thread so the
+            # UI keeps redrawing; playback starts back on the main thread
+            self._pool.submit(self._preview_worker, params)
+
+        except Exception as e:
+            logger.error("Preview failed: %s", e)
+            messagebox.showerror("Preview Error", str(e))
+            self._stop_preview()
+
+    def _preview_worker(self, params):
+        """Generate the preview bassline and MIDI file off the Tk thread"""
+        try:
             bassline = self.generator.generate_bassline(
                 params['root_note'],
                 params['scale_type'],
@@ -203,23 +296,37 @@ class BasslineGeneratorGUI:
                 params['bars'],
                 params['note_density']
             )
-            
-            if not bassline:
+
+            if len(bassline) == 0:
                 raise ValueError("No notes generated for preview")
-            
-            # Create and play preview
+
             preview_path = self.preview_system.create_preview(bassline, params['tempo'])
+
+        except Exception as e:
+            logger.error("Preview failed: %s", e)
+            self.root.after(0, self._preview_failed, str(e))
+            return
+
+        self.root.after(0, self._start_playback, preview_path, params)
+
+    def _preview_failed(self, message):
+        """Report a preview failure and reset the preview controls"""
+        messagebox.showerror("Preview Error", message)
+        self._stop_preview()
+
+    def _start_playback(self, preview_path, params):
+        """Begin playback of a prepared preview file on the Tk thread"""
+        try:
             self.preview_system.play_preview(preview_path)
-            
-            # Update status
-            self.status_text.insert(tk.END, f"Playing preview ({params['bars']} bars)...\n")
-            self.status_text.see(tk.END)
-            
-            # Start monitoring
-            self._monitor_preview()
-            
+            self._update_status(f"Playing preview ({params['bars']} bars)...\n")
+
+            # Wake up once near the expected end of playback instead of
+            # polling every 100 ms for the whole preview
+            expected_ms = int(params['bars'] * 4 * 60000 / params['tempo'])
+            self._monitor_preview(expected_ms)
+
         except Exception as e:
-            logger.error(f"Preview failed: {e}")
+            logger.error("Preview failed: %s", e)
             messagebox.showerror("Preview Error", str(e))
             self._stop_preview()
 
@@ -227,52 +334,56 @@ class BasslineGeneratorGUI:
         """Stop the current preview playback"""
         logger.debug("Stopping preview playback")
         try:
+            if self._monitor_after_id is not None:
+                self.root.after_cancel(self._monitor_after_id)
+                self._monitor_after_id = None
             self.preview_system.stop_preview()
             self.preview_btn.state(['!disabled'])
             self.stop_preview_btn.state(['disabled'])
             
-            self.status_text.insert(tk.END, "Preview stopped\n")
-            self.status_text.see(tk.END)
+            self._update_status("Preview stopped\n")
             
         except Exception as e:
-            logger.error(f"Error stopping preview: {e}")
+            logger.error("Error stopping preview: %s", e)
             messagebox.showerror("Preview Error", f"Failed to stop preview: {e}")
 
-    def _monitor_preview(self):
-        """Monitor preview playback status"""
+    def _monitor_preview(self, expected_ms=None):
+        """
+        Monitor preview playback status.
+
+        Sleeps until just before the expected finish time on the first
+        check, then falls back to short polls only if playback ran long.
+        """
+        self._monitor_after_id = None
         try:
             if self.preview_system.is_playing():
-                self.root.after(100, self._monitor_preview)
+                delay = expected_ms if expected_ms is not None else 250
+                self._monitor_after_id = self.root.after(delay, self._monitor_preview)
             else:
                 self._stop_preview()
         except Exception as e:
-            logger.error(f"Error monitoring preview: {e}")
+            logger.error("Error monitoring preview: %s", e)
             self._stop_preview()
 
     def _generate_bassline(self):
         """Handle full bassline generation in a separate thread"""
+        if self.generator is None:
+            return
         try:
             self.generate_btn.state(['disabled'])
             self.dice_roll_btn.state(['disabled'])
             
-            self.status_text.insert(tk.END, "Generating bassline...\n")
-            self.status_text.see(tk.END)
-            
-            params = {
-                'root_note': self.root_note_var.get(),
-                'scale_type': self.scale_type_var.get(),
-                'genre': self.genre_var.get(),
-                'tempo': int(self.tempo_var.get()),
-                'bars': int(self.bars_var.get()),
-                'note_density': self.density_var.get()
-            }
+            self._update_status("Generating bassline...\n")
             
-            thread = threading.Thread(target=self._generate_bassline_thread, args=(params,))
-            thread.daemon = True
-            thread.start()
+            params = self._current_params()
+
+            future = self._pool.submit(self._generate_bassline_thread, params)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._enable_controls)
+            )
             
         except Exception as e:
-            logger.error(f"Failed to start generation: {e}")
+            logger.error("Failed to start generation: %s", e)
             messagebox.showerror("Error", f"Failed to generate bassline: {e}")
             self._enable_controls()
 
@@ -293,13 +404,13 @@ class BasslineGeneratorGUI:
             self.root.after(0, self._update_status, f"Successfully generated: {filepath}\n")
             
         except Exception as e:
-            logger.error(f"Generation failed: {e}")
+            logger.error("Generation failed: %s", e)
             self.root.after(0, messagebox.showerror, "Error", f"Generation failed: {e}")
-        finally:
-            self.root.after(0, self._enable_controls)
 
     def _roll_parameters(self):
         """Generate random musical parameters"""
+        if self.generator is None:
+            return
         params = DiceRoller.roll_parameters(self.generator)
         
         self.root_note_var.set(params['root_note'])
@@ -314,55 +425,79 @@ class BasslineGeneratorGUI:
         self.instrument_var.set(random.choice(instruments))
         self.preview_system.set_instrument(self.instrument_var.get())
         
-        self.status_text.insert(tk.END, "Generated random parameters\n")
-        self.status_text.see(tk.END)
+        self._update_status("Generated random parameters\n")
 
     def _update_status(self, message):
-        """Update status text display"""
-        self.status_text.insert(tk.END, message)
-        self.status_text.see(tk.END)
+        """Queue a status message for the next batched display flush"""
+        self._status_buffer.append(message)
+        if not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            self.root.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Flush all queued status messages with a single Text insert"""
+        self._status_flush_scheduled = False
+        if self._status_buffer:
+            self.status_text.insert(tk.END, "".join(self._status_buffer))
+            self._status_buffer.clear()
+
+            # Keep the widget bounded so long sessions don't slow layout
+            line_count = int(self.status_text.index('end-1c').split('.')[0])
+            if line_count > 1000:
+                self.status_text.delete('1.0', 'end-1000lines')
+
+            self.status_text.see(tk.END)
 
     def _enable_controls(self):
         """Re-enable control buttons"""
         self.generate_btn.state(['!disabled'])
         self.dice_roll_btn.state(['!disabled'])
 
+    # ttk styles are process-global; configure them for the first window only
+    _styles_configured = False
+
     def _apply_styling(self):
         """Apply visual styling to GUI elements"""
-        style = ttk.Style()
-        style.configure("TButton", padding=6)
-        style.configure("TFrame", padding=5)
-        style.configure("TLabelframe", padding=10)
-        
+        if not BasslineGeneratorGUI._styles_configured:
+            style = ttk.Style()
+            style.configure("TButton", padding=6)
+            style.configure("TFrame", padding=5)
+            style.configure("TLabelframe", padding=10)
+            BasslineGeneratorGUI._styles_configured = True
+
         # Enable proper grid weight distribution
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         self.main_frame.columnconfigure(1, weight=1)
-        
-        # Apply specific styling for instrument controls
-        style.configure("Instrument.TCombobox", padding=4)
 
     def cleanup(self):
         """Clean up resources before shutdown"""
         logger.debug("Performing application cleanup")
-        if hasattr(self, 'preview_system'):
+        if hasattr(self, '_pool'):
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        if getattr(self, 'preview_system', None) is not None:
             self.preview_system.cleanup()
 
 def main():
     """Application entry point"""
     logger.info("Starting Bassline Generator application")
-    
+
+    # Request the low-latency mixer settings before anything else touches
+    # pygame; the first init's values stick for the whole session. pygame
+    # is imported here rather than at module load to keep startup fast.
+    import pygame
+    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
+
     # Initialize random seed for consistent behavior
-    import random
     random.seed()
-    
+
     root = tk.Tk()
     app = BasslineGeneratorGUI(root)
     
     try:
         root.mainloop()
     except Exception as e:
-        logger.error(f"Application error: {e}")
+        logger.error("Application error: %s", e)
         messagebox.showerror("Error", f"Application error: {e}")
     finally:
         logger.info("Shutting down application")
@@ -12,44 +12,50 @@ def main():
     Primary execution function for Bassline Generator.
     """
     generator = BasslineGenerator()
-    
+
+    # Loop invariants hoisted once: frozensets give O(1) membership checks
+    # and the option listings don't get rebuilt on every invalid retry
+    valid_root_notes = frozenset(generator.musical_scales.root_notes)
+    root_note_listing = ', '.join(generator.musical_scales.sorted_root_notes)
+    scale_list = generator.musical_scales.sorted_scales
+    scale_menu = "\nAvailable scales:\n" + "\n".join(
+        f"{i}. {scale.replace('_', ' ').title()}"
+        for i, scale in enumerate(scale_list, 1)
+    )
+    valid_genres = frozenset(generator.rhythm_patterns)
+
     print("\nEnhanced Bassline Generator")
     print("----------------------------")
-    
+
     print("\nAvailable Options:")
     print("1. Manual Parameter Entry")
     print("2. Dice Roll (Random Generation)")
-    
+
     while True:
         try:
             mode = input("\nChoose mode (1/2): ").strip()
-            
+
             if mode == '1':
                 # Manual parameter entry
-                # Access root notes through the musical_scales instance
                 root_note = input("\nEnter root note: ").strip()
-                if root_note not in generator.musical_scales.root_notes:
-                    print(f"Invalid root note. Please choose from: {', '.join(sorted(generator.musical_scales.root_notes.keys()))}")
+                if root_note not in valid_root_notes:
+                    print(f"Invalid root note. Please choose from: {root_note_listing}")
                     continue
-                    
-                # Access scales through the musical_scales instance
-                scale_list = sorted(generator.musical_scales.scales.keys())
+
+                print(scale_menu)
                 while True:
                     try:
-                        print("\nAvailable scales:")
-                        for i, scale in enumerate(scale_list, 1):
-                            print(f"{i}. {scale.replace('_', ' ').title()}")
                         scale_index = int(input("\nEnter scale number: ")) - 1
                         if 0 <= scale_index < len(scale_list):
                             scale_type = scale_list[scale_index]
-                            break 
+                            break
                         else:
                             print("Invalid scale number. Please try again.")
                     except ValueError:
                         print("Invalid input. Please enter a number.")
-                    
+
                 genre = input("Enter genre: ").strip().capitalize()
-                if genre not in generator.rhythm_patterns:
+                if genre not in valid_genres:
                     print("Invalid genre. Please choose from: Funk, Darksynth, Pop, Trap")
                     continue
                     
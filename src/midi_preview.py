@@ -1,17 +1,76 @@
 # midi_preview.py
-import pygame
+import numpy as np
+import os
+import struct
 import tempfile
+import threading
 from pathlib import Path
-import time
-from midiutil import MIDIFile
 import logging
-from typing import List, Dict, Union, Optional
+from typing import Optional
 
-# Configure logging for debugging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# pygame's import alone drags in SDL and friends, so it is loaded lazily
+# in MIDIPreview.__init__ rather than at module import
+pygame = None
+
+def _encode_vlq(value: int) -> bytes:
+    """Encode a delta time as a MIDI variable-length quantity."""
+    data = bytearray([value & 0x7F])
+    value >>= 7
+    while value:
+        data.insert(0, 0x80 | (value & 0x7F))
+        value >>= 7
+    return bytes(data)
+
+def _write_mid(bassline, tempo: int, program: int, tpq: int = 480) -> bytes:
+    """
+    Serialize a bassline straight to format-0 SMF bytes.
+
+    The timing math runs vectorized over the bassline field arrays and
+    the event loop packs raw status bytes, skipping midiutil's per-note
+    event objects and sort-on-close machinery entirely.
+
+    Args:
+        bassline: Structured numpy array of notes
+        tempo: Tempo in beats per minute
+        program: General MIDI program number for the single track
+        tpq: Ticks per quarter note
+
+    Returns:
+        Complete MIDI file contents
+    """
+    channel = 0
+    num_notes = len(bassline)
+
+    # Note-on/note-off ticks computed in bulk; offs sort before ons at
+    # equal ticks so re-struck notes are never cut short
+    on_ticks = bassline['position'].astype(np.int64) * (tpq // 4)
+    off_ticks = on_ticks + (bassline['duration'] * tpq).astype(np.int64)
+    ticks = np.concatenate([on_ticks, off_ticks])
+    is_on = np.concatenate([np.ones(num_notes, np.int8), np.zeros(num_notes, np.int8)])
+    pitches = np.concatenate([bassline['note'], bassline['note']])
+    velocities = np.concatenate([bassline['velocity'], np.zeros(num_notes, np.int8)])
+    order = np.lexsort((is_on, ticks))
+
+    track = bytearray()
+    track += b'\x00\xff\x51\x03' + struct.pack('>I', 60000000 // tempo)[1:]
+    track += bytes((0x00, 0xC0 | channel, program))
+
+    note_on = 0x90 | channel
+    note_off = 0x80 | channel
+    previous_tick = 0
+    for tick, on, pitch, velocity in zip(
+        ticks[order].tolist(), is_on[order].tolist(),
+        pitches[order].tolist(), velocities[order].tolist()
+    ):
+        track += _encode_vlq(tick - previous_tick)
+        track += bytes((note_on if on else note_off, pitch, velocity))
+        previous_tick = tick
+    track += b'\x00\xff\x2f\x00'
+
+    header = struct.pack('>4sIHHH', b'MThd', 6, 0, 1, tpq)
+    return header + struct.pack('>4sI', b'MTrk', len(track)) + bytes(track)
+
+# Logging configuration is owned by the application entry point
 logger = logging.getLogger(__name__)
 
 class MIDIPreview:
@@ -32,28 +91,57 @@ class MIDIPreview:
         'Synth Bass 1': 38,
         'Synth Bass 2': 39
     }
-    
-    def __init__(self) -> None:
+
+    # Sorted once at class creation; get_available_instruments reuses it
+    _AVAILABLE_INSTRUMENTS = tuple(sorted(BASS_INSTRUMENTS))
+
+    def __init__(self, buffer_samples: int = 512) -> None:
         """
         Initialize the MIDI preview system.
         Sets up pygame mixer and creates a temporary directory for MIDI files.
         Initializes default bass instrument.
+
+        Args:
+            buffer_samples: Mixer buffer size in samples. The 512 default
+                keeps press-to-hear latency around 11 ms at 44.1 kHz;
+                raise it if playback stutters on slower machines.
         """
+        global pygame
+        if pygame is None:
+            import pygame
+
         try:
-            # Initialize pygame mixer with optimal audio settings
+            # Initialize pygame mixer with low-latency audio settings
             pygame.mixer.init(
                 frequency=44100,
                 size=-16,
                 channels=2,
-                buffer=2048
+                buffer=buffer_samples
             )
             
             # Create temporary directory for MIDI files
             self._temp_dir = Path(tempfile.mkdtemp(prefix='midi_preview_'))
             self._current_preview: Optional[Path] = None
             self._current_instrument = 'Synth Bass 1'  # Default instrument
+
+            # Recently built preview files keyed by (notes, tempo,
+            # instrument); re-pressing Preview with unchanged settings
+            # reuses the file instead of rebuilding it
+            self._preview_cache: dict = {}
+            self._preview_cache_size = 8
+            self._preview_counter = 0
+
+            # Optional FluidSynth pre-render: decoded PCM Sounds play
+            # instantly, skipping SDL's per-play MIDI synth spin-up
+            try:
+                from midi2audio import FluidSynth
+                self._fluidsynth = FluidSynth()
+            except Exception:
+                self._fluidsynth = None
+            self._sounds: dict = {}
+            self._current_channel = None
             
-            logger.debug(f"Initialized MIDIPreview system. Temp dir: {self._temp_dir}")
+            logger.debug("Initialized MIDIPreview system. Temp dir: %s", self._temp_dir)
             
         except pygame.error as e:
             raise RuntimeError(f"Failed to initialize audio system: {e}")
@@ -73,87 +161,104 @@ class MIDIPreview:
         if instrument_name not in self.BASS_INSTRUMENTS:
             raise ValueError(f"Invalid instrument. Choose from: {', '.join(self.BASS_INSTRUMENTS.keys())}")
         self._current_instrument = instrument_name
-        logger.debug(f"Set instrument to: {instrument_name}")
+        logger.debug("Set instrument to: %s", instrument_name)
 
-    def get_available_instruments(self) -> List[str]:
+    def get_available_instruments(self) -> tuple:
         """
-        Get list of available bass instruments.
-        
+        Get the available bass instruments.
+
         Returns:
-            List of instrument names sorted alphabetically
+            Tuple of instrument names sorted alphabetically
         """
-        return sorted(self.BASS_INSTRUMENTS.keys())
+        return self._AVAILABLE_INSTRUMENTS
 
-    def create_preview(self, bassline: List[Dict[str, Union[int, float]]], tempo: int = 120) -> Path:
+    def create_preview(self, bassline, tempo: int = 120) -> Path:
         """
         Create a temporary MIDI file for preview playback.
-        
+
         Args:
-            bassline: List of note dictionaries with keys:
+            bassline: Structured numpy array of notes with fields:
                      'note' (int): MIDI note number
                      'position' (int/float): Beat position
                      'duration' (float): Note duration in beats
                      'velocity' (int): Note velocity (0-127)
             tempo: Playback tempo in BPM
-            
+
         Returns:
             Path object pointing to the created MIDI file
-            
+
         Raises:
             ValueError: If bassline is empty or invalid
             RuntimeError: If MIDI file creation fails
         """
-        if not bassline:
+        if len(bassline) == 0:
             raise ValueError("Cannot create preview: empty bassline")
-            
+
+        # Identical settings produce identical files; reuse the cached one
+        cache_key = (bassline.tobytes(), tempo, self._current_instrument)
+        cached_path = self._preview_cache.get(cache_key)
+        if cached_path is not None and cached_path.exists():
+            logger.debug("Reusing cached preview: %s", cached_path)
+            return cached_path
+
         try:
-            # Create unique filename using timestamp
-            current_time = int(time.time())
-            preview_path = self._temp_dir / f"preview_{current_time}.mid"
-            
-            # Initialize MIDI file with explicit parameters
-            midi = MIDIFile(
-                numTracks=1,
-                removeDuplicates=True,
-                deinterleave=False
-            )
-            
-            # Define track parameters
-            track_number = 0
-            channel = 0
-            initial_time = 0
-            
-            # Initialize track
-            midi.addTrackName(track_number, initial_time, "Bassline Preview")
-            midi.addTempo(track_number, initial_time, tempo)
-            
-            # Add program change for bass instrument
+            # Create unique filename; a counter can't collide the way
+            # same-second timestamps could
+            self._preview_counter += 1
+            preview_path = self._temp_dir / f"preview_{self._preview_counter}.mid"
+
+            # Serialize straight to SMF bytes for the selected instrument
             program_number = self.BASS_INSTRUMENTS[self._current_instrument]
-            midi.addProgramChange(track_number, channel, initial_time, program_number)
-            
-            # Add all notes with explicit timing
-            for note in bassline:
-                beat_position = float(note['position']) / 4.0
-                midi.addNote(
-                    track=track_number,
-                    channel=channel,
-                    pitch=note['note'],
-                    time=beat_position,
-                    duration=note['duration'],
-                    volume=note['velocity']
-                )
-            
-            # Write MIDI file with error handling
-            with open(preview_path, "wb") as output_file:
-                midi.writeFile(output_file)
-            
-            logger.debug(f"Created preview MIDI file: {preview_path}")
+            midi_bytes = _write_mid(bassline, tempo, program_number)
+
+            # Write to a temp name and move into place, so a concurrent
+            # mixer load can never observe a half-written file
+            tmp_path = preview_path.with_suffix('.mid.tmp')
+            tmp_path.write_bytes(midi_bytes)
+            os.replace(tmp_path, preview_path)
+
+            # Pre-decode to PCM when FluidSynth is available so play_preview
+            # triggers a ready sample instead of starting a MIDI engine
+            if self._fluidsynth is not None:
+                try:
+                    wav_path = preview_path.with_suffix('.wav')
+                    self._fluidsynth.midi_to_audio(str(preview_path), str(wav_path))
+                    self._sounds[preview_path] = pygame.mixer.Sound(str(wav_path))
+                    wav_path.unlink(missing_ok=True)  # Sound holds the decoded PCM
+                except Exception as e:
+                    logger.warning("FluidSynth pre-render failed, using MIDI playback: %s", e)
+                    self._fluidsynth = None
+
+            # Cache the result, evicting (and deleting) the oldest entry
+            # once the cache is full
+            self._preview_cache[cache_key] = preview_path
+            if len(self._preview_cache) > self._preview_cache_size:
+                oldest_path = self._preview_cache.pop(next(iter(self._preview_cache)))
+                self._sounds.pop(oldest_path, None)
+                self._release_music_handle(oldest_path)
+                oldest_path.unlink(missing_ok=True)
+
+            logger.debug("Created preview MIDI file: %s", preview_path)
             return preview_path
             
         except Exception as e:
-            logger.error(f"Failed to create MIDI preview: {e}")
+            logger.error("Failed to create MIDI preview: %s", e)
             raise RuntimeError(f"Failed to create MIDI preview: {e}")
 
+    def _release_music_handle(self, midi_path: Path) -> None:
+        """
+        Unload the mixer's music stream if it still holds midi_path.
+
+        Windows keeps loaded files locked; unloading before deletion
+        avoids a failed unlink.
+        """
+        if self._current_preview == midi_path:
+            try:
+                pygame.mixer.music.unload()
+            except pygame.error as e:
+                logger.warning("Error unloading music stream: %s", e)
+            self._current_preview = None
+
     def play_preview(self, midi_path: Path) -> None:
         """
         Play a MIDI preview file with error handling.
@@ -167,16 +272,22 @@ class MIDIPreview:
         """
         if not midi_path.exists():
             raise FileNotFoundError(f"MIDI file not found: {midi_path}")
-            
+
         try:
             self.stop_preview()  # Stop any current playback
-            pygame.mixer.music.load(str(midi_path))
-            pygame.mixer.music.play()
+
+            # Pre-decoded PCM plays instantly when available
+            sound = self._sounds.get(midi_path)
+            if sound is not None:
+                self._current_channel = sound.play()
+            else:
+                pygame.mixer.music.load(str(midi_path))
+                pygame.mixer.music.play()
             self._current_preview = midi_path
-            logger.debug(f"Started playback: {midi_path}")
+            logger.debug("Started playback: %s", midi_path)
             
         except pygame.error as e:
-            logger.error(f"Playback failed: {e}")
+            logger.error("Playback failed: %s", e)
             raise RuntimeError(f"Failed to play MIDI preview: {e}")
 
     def stop_preview(self) -> None:
@@ -185,11 +296,15 @@ class MIDIPreview:
         Handles edge cases where mixer might not be initialized.
         """
         try:
+            if self._current_channel is not None:
+                if self._current_channel.get_busy():
+                    self._current_channel.stop()
+                self._current_channel = None
             if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
                 pygame.mixer.music.stop()
                 logger.debug("Stopped playback")
         except pygame.error as e:
-            logger.warning(f"Error stopping playback: {e}")
+            logger.warning("Error stopping playback: %s", e)
 
     def is_playing(self) -> bool:
         """
@@ -199,6 +314,8 @@ class MIDIPreview:
             bool: True if preview is playing, False otherwise
         """
         try:
+            if self._current_channel is not None and self._current_channel.get_busy():
+                return True
             return bool(pygame.mixer.music.get_busy())
         except pygame.error:
             return False
@@ -210,27 +327,36 @@ class MIDIPreview:
         """
         logger.debug("Starting cleanup")
         
-        # Stop playback
+        # Stop playback and release any loaded file handle
         self.stop_preview()
-        
-        # Remove temporary files
+        if self._current_preview is not None:
+            self._release_music_handle(self._current_preview)
+
+        # Remove temporary files, including any orphaned .tmp leftovers
         try:
-            for file in self._temp_dir.glob("*.mid"):
+            for file in self._temp_dir.glob("preview_*"):
                 try:
                     file.unlink()
-                    logger.debug(f"Removed temp file: {file}")
+                    logger.debug("Removed temp file: %s", file)
                 except Exception as e:
-                    logger.warning(f"Failed to remove file {file}: {e}")
+                    logger.warning("Failed to remove file %s: %s", file, e)
             
             self._temp_dir.rmdir()
             logger.debug("Removed temp directory")
             
         except Exception as e:
-            logger.error(f"Cleanup error: {e}")
+            logger.error("Cleanup error: %s", e)
         
-        # Quit pygame mixer
+        # Quit pygame mixer in a background thread; SDL teardown can block
+        # for tens of ms draining the audio thread, and window close
+        # shouldn't wait on it for more than half a second
         try:
-            pygame.mixer.quit()
-            logger.debug("Pygame mixer shutdown complete")
+            quit_thread = threading.Thread(target=pygame.mixer.quit, daemon=True)
+            quit_thread.start()
+            quit_thread.join(timeout=0.5)
+            if quit_thread.is_alive():
+                logger.warning("Mixer shutdown still draining; left to daemon thread")
+            else:
+                logger.debug("Pygame mixer shutdown complete")
         except pygame.error as e:
-            logger.warning(f"Error during pygame shutdown: {e}")
+            logger.warning("Error during pygame shutdown: %s", e)
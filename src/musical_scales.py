@@ -4,105 +4,224 @@ Musical Scales and Note Utilities Module
 Provides comprehensive musical scale and note-related functionality.
 """
 
+import functools
+import sys
+import types
+import numpy as np
+
+@functools.lru_cache(maxsize=512)
+def _generate_scale_cached(root_midi, intervals, octaves):
+    """
+    Build one scale as an immutable tuple of MIDI note numbers.
+
+    A flat comprehension beats both the old append loop (no per-element
+    method call) and a NumPy round-trip, which costs more than it saves
+    on arrays this small. The argument space is tiny (17 roots x 21
+    scales x a few octave counts), so memoizing makes repeat scale
+    requests a dict lookup.
+    """
+    # Compute the first octave once; higher octaves only add the offset,
+    # halving the adds for the default two octaves
+    base = [root_midi + interval for interval in intervals]
+    return tuple(
+        note + octave_offset
+        for octave_offset in range(0, octaves * 12, 12)
+        for note in base
+    )
+
+@functools.lru_cache(maxsize=512)
+def _generate_scale_array(root_midi, intervals, octaves):
+    """Build one scale as a frozen int16 array, shared across callers."""
+    notes = np.asarray(
+        _generate_scale_cached(root_midi, intervals, octaves), dtype=np.int16
+    )
+    notes.flags.writeable = False
+    return notes
+
 class MusicalScales:
     """
     Comprehensive musical scale and note management utility.
-    
+
     Supports multiple scale types, root notes, and musical transformations.
+    All lookup tables are immutable class-level constants shared by every
+    instance, so construction allocates nothing.
     """
-    
-    def __init__(self):
-        """
-        Initialize musical scale and note configurations.
-        Provides an extensive collection of musical scales and root notes.
-        """
-        self.scales = {
-            # Standard Scales
-            'major': [0, 2, 4, 5, 7, 9, 11],
-            'minor': [0, 2, 3, 5, 7, 8, 10],
-            'pentatonic_major': [0, 2, 4, 7, 9],
-            'pentatonic_minor': [0, 3, 5, 7, 10],
-            'blues': [0, 3, 5, 6, 7, 10],
-            
-            # Church Modes 
-            'dorian': [0, 2, 3, 5, 7, 9, 10],
-            'phrygian': [0, 1, 3, 5, 7, 8, 10],
-            'lydian': [0, 2, 4, 6, 7, 9, 11],
-            'mixolydian': [0, 2, 4, 5, 7, 9, 10],
-            'locrian': [0, 1, 3, 5, 6, 8, 10],
-            
-            # Modified Minor Scales
-            'harmonic_minor': [0, 2, 3, 5, 7, 8, 11],
-            'melodic_minor': [0, 2, 3, 5, 7, 9, 11],
-            'hungarian_minor': [0, 2, 3, 6, 7, 8, 11],
-            
-            # World Music Scales
-            'hirajoshi': [0, 2, 3, 7, 8],
-            'persian': [0, 1, 4, 5, 6, 8, 11],
-            'byzantine': [0, 1, 4, 5, 7, 8, 11],
-            'egyptian': [0, 2, 5, 7, 10],
-            
-            # Synthetic Scales
-            'whole_tone': [0, 2, 4, 6, 8, 10],
-            'diminished': [0, 2, 3, 5, 6, 8, 9, 11],
-            'prometheus': [0, 2, 4, 6, 9, 10],
-            'enigmatic': [0, 1, 4, 6, 8, 10, 11]
-        }
-
-        self.root_notes = {
-            'C': 36, 'C#': 37, 'Db': 37, 
-            'D': 38, 'D#': 39, 'Eb': 39,
-            'E': 40, 'F': 41, 'F#': 42, 
-            'Gb': 42, 'G': 43, 'G#': 44,
-            'Ab': 44, 'A': 45, 'A#': 46, 
-            'Bb': 46, 'B': 47
-        }
+
+    scales = types.MappingProxyType({
+        # Standard Scales
+        'major': [0, 2, 4, 5, 7, 9, 11],
+        'minor': [0, 2, 3, 5, 7, 8, 10],
+        'pentatonic_major': [0, 2, 4, 7, 9],
+        'pentatonic_minor': [0, 3, 5, 7, 10],
+        'blues': [0, 3, 5, 6, 7, 10],
+
+        # Church Modes
+        'dorian': [0, 2, 3, 5, 7, 9, 10],
+        'phrygian': [0, 1, 3, 5, 7, 8, 10],
+        'lydian': [0, 2, 4, 6, 7, 9, 11],
+        'mixolydian': [0, 2, 4, 5, 7, 9, 10],
+        'locrian': [0, 1, 3, 5, 6, 8, 10],
+
+        # Modified Minor Scales
+        'harmonic_minor': [0, 2, 3, 5, 7, 8, 11],
+        'melodic_minor': [0, 2, 3, 5, 7, 9, 11],
+        'hungarian_minor': [0, 2, 3, 6, 7, 8, 11],
+
+        # World Music Scales
+        'hirajoshi': [0, 2, 3, 7, 8],
+        'persian': [0, 1, 4, 5, 6, 8, 11],
+        'byzantine': [0, 1, 4, 5, 7, 8, 11],
+        'egyptian': [0, 2, 5, 7, 10],
+
+        # Synthetic Scales
+        'whole_tone': [0, 2, 4, 6, 8, 10],
+        'diminished': [0, 2, 3, 5, 6, 8, 9, 11],
+        'prometheus': [0, 2, 4, 6, 9, 10],
+        'enigmatic': [0, 1, 4, 6, 8, 10, 11]
+    })
+
+    # Keys are interned so lookups with literal note names hash-compare
+    # by pointer; callers building names dynamically can sys.intern them
+    # to get the same fast path
+    root_notes = types.MappingProxyType({sys.intern(name): midi for name, midi in {
+        'C': 36, 'C#': 37, 'Db': 37,
+        'D': 38, 'D#': 39, 'Eb': 39,
+        'E': 40, 'F': 41, 'F#': 42,
+        'Gb': 42, 'G': 43, 'G#': 44,
+        'Ab': 44, 'A': 45, 'A#': 46,
+        'Bb': 46, 'B': 47
+    }.items()})
+
+    # Sorted option tuples computed once; accessors and UI code reuse
+    # them instead of re-sorting the dict keys on every call
+    sorted_scales = tuple(sorted(scales))
+    sorted_root_notes = tuple(sorted(root_notes))
+
+    # Hashable interval tuples for the memoized builders
+    _interval_tuples = {
+        name: tuple(intervals) for name, intervals in scales.items()
+    }
+
+    # Option listings for error messages, joined once instead of
+    # re-sorting and re-joining on every failed validation
+    _ROOTS_MSG = ', '.join(sorted(root_notes))
+    _SCALES_MSG = ', '.join(sorted(scales))
 
     def generate_scale(self, root_note, scale_type, octaves=2):
         """
         Generate a musical scale based on root note and scale type.
-        
+
         Args:
-            root_note (str): Musical root note (e.g., 'C', 'G#')
-            scale_type (str): Type of musical scale 
+            root_note (str or int): Musical root note name (e.g., 'C',
+                'G#') or a raw MIDI note number, which skips the name
+                lookup entirely
+            scale_type (str): Type of musical scale
             octaves (int, optional): Number of octaves to generate. Defaults to 2.
-        
+
         Returns:
-            list: MIDI note numbers representing the generated scale
-        
+            tuple: MIDI note numbers representing the generated scale.
+                The tuple is cached and shared; use generate_scale_list
+                for a mutable copy.
+
         Raises:
             ValueError: If root note or scale type is invalid
         """
-        if root_note not in self.root_notes:
-            raise ValueError(f"Invalid root note. Choose from: {', '.join(sorted(self.root_notes.keys()))}")
-        if scale_type not in self.scales:
-            raise ValueError(f"Invalid scale type. Choose from: {', '.join(sorted(self.scales.keys()))}")
-            
-        root_midi = self.root_notes[root_note]
-        scale_intervals = self.scales[scale_type]
-        scale_notes = []
-        
-        for octave in range(octaves):
-            for interval in scale_intervals:
-                note = root_midi + interval + (octave * 12) 
-                scale_notes.append(note)
-        
-        return scale_notes
+        # The full (root midi, scale, octaves) result table is precomputed
+        # at import, so valid requests are a single dict fetch; keying on
+        # the midi number collapses enharmonic aliases like C#/Db
+        root_midi = root_note if isinstance(root_note, int) else self.root_notes.get(root_note)
+        notes = _PRECOMPUTED.get((root_midi, scale_type, octaves))
+        if notes is not None:
+            return notes
+        return self._generate_scale_slow(root_note, scale_type, octaves)
+
+    def generate_scale_list(self, root_note, scale_type, octaves=2):
+        """
+        Generate a musical scale as a fresh mutable list.
+
+        Back-compat wrapper over generate_scale for callers that modify
+        the returned sequence.
+        """
+        return list(self.generate_scale(root_note, scale_type, octaves))
+
+    def _resolve_root_midi(self, root_note):
+        """Resolve a note name or raw MIDI number to a MIDI number."""
+        if isinstance(root_note, int):
+            return root_note
+        # dict.get with a sentinel check costs one hash probe where the
+        # membership-test-then-index pattern cost two
+        root_midi = self.root_notes.get(root_note)
+        if root_midi is None:
+            raise ValueError(f"Invalid root note. Choose from: {self._ROOTS_MSG}")
+        return root_midi
+
+    def _generate_scale_slow(self, root_note, scale_type, octaves):
+        """
+        Validate arguments and build a scale outside the precomputed table
+        (raw MIDI roots, unusual octave counts); also the error path for
+        invalid input.
+        """
+        root_midi = self._resolve_root_midi(root_note)
+        intervals = self._interval_tuples.get(scale_type)
+        if intervals is None:
+            raise ValueError(f"Invalid scale type. Choose from: {self._SCALES_MSG}")
+
+        return _generate_scale_cached(root_midi, intervals, octaves)
+
+    def generate_scale_np(self, root_note, scale_type, octaves=2):
+        """
+        Generate a musical scale as a read-only NumPy array.
+
+        The fast path for vectorized consumers: the returned array is
+        cached and frozen, so callers can slice and share it without
+        defensive copies.
+
+        Args:
+            root_note (str or int): Musical root note name or raw MIDI
+                note number
+            scale_type (str): Type of musical scale
+            octaves (int, optional): Number of octaves to generate. Defaults to 2.
+
+        Returns:
+            numpy.ndarray: Read-only int16 array of MIDI note numbers
+
+        Raises:
+            ValueError: If root note or scale type is invalid
+        """
+        root_midi = self._resolve_root_midi(root_note)
+        intervals = self._interval_tuples.get(scale_type)
+        if intervals is None:
+            raise ValueError(f"Invalid scale type. Choose from: {self._SCALES_MSG}")
+
+        return _generate_scale_array(root_midi, intervals, octaves)
 
     def get_available_scales(self):
         """
         Retrieve all available musical scales.
         
         Returns:
-            list: Names of available musical scales
+            tuple: Names of available musical scales, sorted alphabetically
         """
-        return sorted(list(self.scales.keys()))
+        return self.sorted_scales
 
     def get_available_root_notes(self):
         """
         Retrieve all available root notes.
         
         Returns:
-            list: Available root note names
+            tuple: Available root note names, sorted alphabetically
         """
-        return sorted(list(self.root_notes.keys()))
+        return self.sorted_root_notes
+
+# Every (root midi, scale, octaves) result up to _MAX_PRECOMPUTED_OCTAVES,
+# built once at import so generate_scale degenerates to one dict fetch.
+# Keying on the midi number folds the seven enharmonic alias names into
+# their twelve distinct pitches. The undecorated builder keeps the
+# lru_cache free for fallback requests.
+_MAX_PRECOMPUTED_OCTAVES = 8
+_PRECOMPUTED = {
+    (midi, scale, octaves): _generate_scale_cached.__wrapped__(midi, intervals, octaves)
+    for midi in set(MusicalScales.root_notes.values())
+    for scale, intervals in MusicalScales._interval_tuples.items()
+    for octaves in range(1, _MAX_PRECOMPUTED_OCTAVES + 1)
+}
@@ -0,0 +1,36 @@
+"""
+Environment Verification Script
+
+Prints the Python runtime details and installed packages so users can
+confirm their virtual environment is ready for the bassline generator.
+Run automatically by run_debug.bat.
+"""
+
+import sys
+from importlib.metadata import distributions
+
+def verify_setup():
+    """Print Python version, executable path, packages and sys.path."""
+    lines = [
+        f"Python Version: {sys.version}",
+        f"Python Executable: {sys.executable}",
+        "",
+        "Installed packages:"
+    ]
+
+    # importlib.metadata enumerates dist-info lazily, unlike the old
+    # pkg_resources.working_set scan that re-parsed all metadata up front
+    lines.extend(
+        f"  - {dist.metadata['Name'] or '<unknown>'} {dist.version}"
+        for dist in sorted(distributions(), key=lambda d: (d.metadata['Name'] or '').lower())
+    )
+
+    lines.append("")
+    lines.append("sys.path entries:")
+    lines.extend(f"  - {entry}" for entry in sys.path)
+
+    # One buffered write instead of a print (and flush) per package
+    sys.stdout.write("\n".join(lines) + "\n")
+
+if __name__ == "__main__":
+    verify_setup()